@@ -1,8 +1,22 @@
+import gc
+import os
+
+# Inference runs on a single row, so multi-threaded BLAS/OpenMP only adds overhead.
+# These only take effect if numpy isn't loaded yet, i.e. when app.py is imported on its own;
+# `streamlit run` has already imported numpy, so there threadpool_limits() in load_pipeline
+# is what caps the threads. Set them in the launch environment to cover both cases.
+os.environ["OPENBLAS_NUM_THREADS"] = "1"
+os.environ["MKL_NUM_THREADS"] = "1"
+os.environ["OMP_NUM_THREADS"] = "1"
+
 import streamlit as st
 import pandas as pd
 import joblib
 import numpy as np
 from PIL import Image
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from threadpoolctl import threadpool_limits
 
 # Set page config
 st.set_page_config(
@@ -12,20 +26,285 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load the trained pipeline
-@st.cache_resource
+FEATURE_COLUMNS = ['pH', 'Temperature (°C)', 'Turbidity (NTU)', 
+                   'Dissolved Oxygen (mg/L)', 'Conductivity (µS/cm)']
+
+def make_input(pipe, rows):
+    """Shape raw feature rows the way the model was fitted (DataFrame only if it has column names)."""
+    if hasattr(pipe, 'feature_names_in_'):
+        return pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+    return np.asarray(rows, dtype=np.float32)
+
+def probe_rows(n=64):
+    """Deterministic sample rows spanning the slider ranges, for load-time sanity checks."""
+    rng = np.random.default_rng(0)
+    return rng.uniform([0, 0, 0, 0, 0], [14, 50, 3, 200, 20000], size=(n, len(FEATURE_COLUMNS)))
+
+def downcast_model(pipe):
+    """Cast linear model weights to float32, keeping the original if predictions drift.
+
+    Tree ensembles are left as-is: sklearn's Tree only accepts float64 node arrays
+    and already evaluates inputs as float32.
+    """
+    estimator = pipe.steps[-1][1] if hasattr(pipe, 'steps') else pipe
+    if not (hasattr(estimator, 'coef_') and hasattr(estimator, 'intercept_')):
+        return pipe
+
+    probe = make_input(pipe, probe_rows())
+    expected = pipe.predict_proba(probe)
+
+    coef, intercept = estimator.coef_, estimator.intercept_
+    estimator.coef_ = coef.astype(np.float32)
+    estimator.intercept_ = np.asarray(intercept).astype(np.float32)
+    if not np.allclose(pipe.predict_proba(probe), expected, atol=1e-4):
+        estimator.coef_, estimator.intercept_ = coef, intercept
+    return pipe
+
+def specialize_predict_proba(pipe):
+    """Build a single-row predict_proba with the model's parameters baked in.
+
+    Supports a bare RandomForestClassifier (trees walked over plain Python lists) and
+    a binary LogisticRegression (one dot product). Returns None for anything else, or
+    if the specialized version disagrees with sklearn on the probe rows.
+    """
+    if isinstance(pipe, RandomForestClassifier) and pipe.n_outputs_ == 1:
+        trees = []
+        for estimator in pipe.estimators_:
+            tree = estimator.tree_
+            value = tree.value[:, 0, :]
+            trees.append((tree.children_left.tolist(), tree.children_right.tolist(),
+                          tree.feature.tolist(), tree.threshold.tolist(),
+                          value / value.sum(axis=1, keepdims=True)))
+        n_trees = len(trees)
+
+        def fast_predict_proba(row):
+            # sklearn compares float32 inputs against the float64 thresholds
+            x = np.asarray(row, dtype=np.float32).tolist()
+            total = 0.0
+            for left, right, feature, threshold, value in trees:
+                node = 0
+                while left[node] != -1:
+                    node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+                total = total + value[node]
+            return total / n_trees
+    elif isinstance(pipe, LogisticRegression) and pipe.coef_.shape[0] == 1:
+        weights, bias = pipe.coef_[0], pipe.intercept_[0]
+
+        def fast_predict_proba(row):
+            positive = 1.0 / (1.0 + np.exp(-(np.asarray(row, dtype=np.float32) @ weights + bias)))
+            return np.array([1.0 - positive, positive])
+    else:
+        return None
+
+    probe = probe_rows()
+    expected = pipe.predict_proba(make_input(pipe, probe))
+    actual = np.array([fast_predict_proba(row) for row in probe])
+    if not np.allclose(actual, expected, atol=1e-9):
+        return None
+    return fast_predict_proba
+
+MODEL_PATH = 'water_quality_model.pkl'
+
+# Load the trained pipeline and its specialized predictor, once per process
+@st.cache_resource(max_entries=1)
 def load_pipeline():
-    return joblib.load('water_quality_model.pkl')
+    # Collect anything left unreachable (e.g. a pipeline dropped by "Clear cache")
+    # before unpickling a new copy
+    gc.collect()
+    # The effective thread cap under `streamlit run`, where numpy is loaded before app.py
+    threadpool_limits(1)
+    pipe = downcast_model(joblib.load(MODEL_PATH))
+    if hasattr(pipe, 'n_jobs'):
+        pipe.n_jobs = 1
+    # Warm up with a dummy row so the first real submission doesn't pay one-off init costs
+    pipe.predict_proba(make_input(pipe, np.zeros((1, len(FEATURE_COLUMNS)))))
+    # Built here so the specialized predictor shares the pipeline's cache entry and lifetime
+    return pipe, specialize_predict_proba(pipe)
 
-pipeline = load_pipeline()
+pipeline, fast_predict_proba = load_pipeline()
 
-# App title and header
-st.title('💧 AquaSafe Pro Water Quality Classifier')
-st.markdown("""
+# Cache predictions per input tuple; sliders snap to discrete steps so repeats are common
+@st.cache_data(max_entries=1024)
+def predict(ph, temperature, turbidity, dissolved_oxygen, conductivity):
+    row = [ph, temperature, turbidity, dissolved_oxygen, conductivity]
+    # One forward pass; the predicted class is the argmax of the probabilities
+    if fast_predict_proba is not None:
+        prediction_proba = fast_predict_proba(row)
+    else:
+        prediction_proba = pipeline.predict_proba(make_input(pipeline, [row]))[0]
+    return pipeline.classes_[np.argmax(prediction_proba)], prediction_proba
+
+# Staircase lookup tables, in FEATURE_COLUMNS order: np.digitize(value, bins) indexes labels.
+# Bins are left-closed, so inclusive upper bounds (pH <= 8.5, <= 9.5) use the next float up.
+PH_UPPER = np.nextafter(8.5, np.inf)
+PH_IRRITATION_UPPER = np.nextafter(9.5, np.inf)
+
+STATUS_BINS = [
+    np.array([4.5, 6.5, PH_UPPER]),
+    np.array([30, 40]),
+    np.array([5, 20]),
+    np.array([3, 6]),
+    np.array([1000, 1500]),
+]
+STATUS_LABELS = [
+    np.array(['❌ Dangerous', '⚠️ Acidic', '✅ Optimal', '⚠️ Alkaline'], dtype=object),
+    np.array(['✅ Normal', '⚠️ Elevated', '❌ Extreme'], dtype=object),
+    np.array(['✅ Clear', '⚠️ Cloudy', '❌ Very Turbid'], dtype=object),
+    np.array(['❌ Hypoxic', '⚠️ Low', '✅ Healthy'], dtype=object),
+    np.array(['✅ Normal', '⚠️ High', '❌ Very High'], dtype=object),
+]
+IMPACT_BINS = [
+    np.array([5.5, 6.5, PH_UPPER, PH_IRRITATION_UPPER]),
+    np.array([30, 40]),
+    np.array([5, 20]),
+    np.array([3, 6]),
+    np.array([1000, 1500]),
+]
+IMPACT_LABELS = [
+    np.array(['Harmful to health', 'May cause irritation', 'Ideal for drinking',
+              'May cause irritation', 'Harmful to health'], dtype=object),
+    np.array(['No direct impact', 'Affects taste', 'Risk of scalding'], dtype=object),
+    np.array(['Clear and safe', 'May harbor pathogens', 'High pathogen risk'], dtype=object),
+    np.array(['Dangerously low oxygen', 'Stressful for organisms', 'Supports aquatic life'], dtype=object),
+    np.array(['Normal mineral content', 'Elevated minerals', 'Very high contamination risk'], dtype=object),
+]
+
+def classify(values, bins, labels):
+    """Look up each value's label in its parameter's staircase table."""
+    return np.array([table[np.digitize(value, edges)]
+                     for value, edges, table in zip(values, bins, labels)], dtype=object)
+
+# Evaluation table layout; only the value/status/impact cells depend on the inputs
+EVAL_COLUMNS = ('Parameter', 'Your Value', 'Safe Range', 'Status', 'Health Impact')
+PARAMETER_NAMES = ('pH', 'Temperature', 'Turbidity', 'Dissolved Oxygen', 'Conductivity')
+SAFE_RANGES = ('6.5-8.5', '< 30°C', '< 5 NTU', '≥ 6 mg/L', '< 1000 µS/cm')
+
+# Fixed width for the evaluation table, so it doesn't need a container-width layout pass
+EVAL_TABLE_WIDTH = len(EVAL_COLUMNS) * 180
+
+# Parameter evaluation is pure in the inputs, so cache it alongside the prediction
+@st.cache_data(max_entries=1024)
+def build_eval_df(ph, temperature, turbidity, dissolved_oxygen, conductivity):
+    values = (ph, temperature, turbidity, dissolved_oxygen, conductivity)
+    your_values = (f"{ph}", f"{temperature}°C", f"{turbidity} NTU",
+                   f"{dissolved_oxygen} mg/L", f"{conductivity} µS/cm")
+    rows = zip(PARAMETER_NAMES, your_values, SAFE_RANGES,
+               classify(values, STATUS_BINS, STATUS_LABELS),
+               classify(values, IMPACT_BINS, IMPACT_LABELS))
+    # All columns are strings, so skip pandas' dtype inference
+    return pd.DataFrame(list(rows), columns=EVAL_COLUMNS, dtype=object)
+
+# Static HTML blocks, kept here so the layout code below stays readable
+HEADER_BANNER_HTML = """
 <div style="background-color:#f0f2f6;padding:10px;border-radius:10px;margin-bottom:20px;">
     <h3 style="color:#1e3d6b;text-align:center;">Advanced water safety analysis with expanded parameter ranges</h3>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+SIDEBAR_CREDIT_HTML = """
+<div style="text-align:center;">
+    <p>Developed with ❤️ using Streamlit</p>
+</div>
+"""
+
+BASIC_PARAMS_HEADER_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">Basic Parameters</h4>
+</div>
+"""
+
+QUALITY_INDICATORS_HEADER_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">Quality Indicators</h4>
+</div>
+"""
+
+PH_CARD_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">pH Level</h4>
+    <p><b>Range:</b> 0-14 (full pH scale)</p>
+    <p><b>Safe Range:</b> 6.5-8.5</p>
+    <p>Measures acidity/alkalinity. Extreme values can be harmful.</p>
+</div>
+"""
+
+TEMP_CARD_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">Temperature</h4>
+    <p><b>Range:</b> 0-50°C</p>
+    <p><b>Safe Range:</b> < 30°C</p>
+    <p>Affects chemical reactions and microbial growth.</p>
+</div>
+"""
+
+DO_CARD_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">Dissolved Oxygen</h4>
+    <p><b>Range:</b> 0-20 mg/L</p>
+    <p><b>Safe Range:</b> ≥ 6 mg/L</p>
+    <p>Essential for aquatic life and water quality.</p>
+</div>
+"""
+
+COND_CARD_HTML = """
+<div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
+    <h4 style="color:#005b96;">Conductivity</h4>
+    <p><b>Range:</b> 0-2000 µS/cm</p>
+    <p><b>Safe Range:</b> < 1000 µS/cm</p>
+    <p>Indicates dissolved inorganic salts and minerals.</p>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align:center;color:#666666;font-size:14px;">
+    <p>AquaSafe Pro Water Quality Classifier v2.0</p>
+    <p>For comprehensive water quality analysis</p>
+</div>
+"""
+
+# Static data for the range chart in the Parameter Ranges tab, built once and cached
+@st.cache_data
+def ranges_chart_df():
+    ranges = pd.DataFrame({
+        'Parameter': ['pH', 'Temperature', 'Turbidity', 'Dissolved Oxygen', 'Conductivity'],
+        'Min': [0, 0, 0, 0, 0],
+        'Max': [14, 50, 100, 20, 2000],
+        'Safe Min': [6.5, None, None, 6, None],
+        'Safe Max': [8.5, 30, 5, None, 1000]
+    })
+    return ranges.set_index('Parameter')[['Min', 'Max']]
+
+# Parameter Ranges tab; static content, rendered on every rerun like the rest of the page
+def render_ranges_tab():
+    st.header("Extended Parameter Ranges")
+    st.markdown("""
+    This enhanced version includes wider measurement ranges for comprehensive water analysis:
+    """)
+    
+    # Parameter range cards
+    cols = st.columns(2)
+    
+    with cols[0]:
+        st.markdown(PH_CARD_HTML, unsafe_allow_html=True)
+        
+        st.markdown(TEMP_CARD_HTML, unsafe_allow_html=True)
+    
+    with cols[1]:
+        st.markdown(DO_CARD_HTML, unsafe_allow_html=True)
+        
+        st.markdown(COND_CARD_HTML, unsafe_allow_html=True)
+    
+    # Range visualization
+    st.markdown("---")
+    st.subheader("Parameter Range Visualization")
+    
+    # Create a dummy plot (replace with actual visualizations if desired)
+    st.bar_chart(ranges_chart_df())
+    st.caption("Full measurement ranges for each parameter")
+
+# App title and header
+st.title('💧 AquaSafe Pro Water Quality Classifier')
+st.markdown(HEADER_BANNER_HTML, unsafe_allow_html=True)
 
 # Sidebar with info
 with st.sidebar:
@@ -45,11 +324,7 @@ with st.sidebar:
     """)
     
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align:center;">
-        <p>Developed with ❤️ using Streamlit</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_CREDIT_HTML, unsafe_allow_html=True)
 
 # Main content area
 tab1, tab2 = st.tabs(["🔍 Water Safety Check", "📊 Parameter Ranges"])
@@ -62,11 +337,7 @@ with tab1:
         cols = st.columns(2)
         
         with cols[0]:
-            st.markdown("""
-            <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-                <h4 style="color:#005b96;">Basic Parameters</h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(BASIC_PARAMS_HEADER_HTML, unsafe_allow_html=True)
             
             # Expanded ranges
             ph = st.slider('pH Level (0-14 scale)', 0.0, 14.0, 7.0, 0.1, 
@@ -75,11 +346,7 @@ with tab1:
                                   help="Water temperature measurement (0-50°C range)")
         
         with cols[1]:
-            st.markdown("""
-            <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-                <h4 style="color:#005b96;">Quality Indicators</h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(QUALITY_INDICATORS_HEADER_HTML, unsafe_allow_html=True)
             
             turbidity = st.slider('Turbidity (NTU)', 0.0, 3.0, 0.01, 0.01,
                                 help="Measure of water clarity (0-100 NTU range)")
@@ -94,15 +361,21 @@ with tab1:
 
     # When form is submitted
     if submitted:
-        # Create input dataframe
-        input_data = pd.DataFrame([[ph, temperature, turbidity, dissolved_oxygen, conductivity]],
-                                columns=['pH', 'Temperature (°C)', 'Turbidity (NTU)', 
-                                        'Dissolved Oxygen (mg/L)', 'Conductivity (µS/cm)'])
+        # Safe-range checks reused by the safety indicators below
+        ph_ok = 6.5 <= ph <= 8.5
+        do_ok = dissolved_oxygen >= 6
+        cond_ok = conductivity < 1000
         
-        # Make prediction
-        prediction = pipeline.predict(input_data)[0]
-        prediction_proba = pipeline.predict_proba(input_data)[0]
-        confidence = max(prediction_proba) * 100
+        # Reuse the last result if the same values are resubmitted
+        inputs = (ph, temperature, turbidity, dissolved_oxygen, conductivity)
+        last = st.session_state.get("last")
+        if last and last[0] == inputs:
+            prediction, confidence = last[1], last[2]
+        else:
+            # Make prediction
+            prediction, prediction_proba = predict(*inputs)
+            confidence = max(prediction_proba) * 100
+            st.session_state["last"] = (inputs, prediction, confidence)
         
         # Display results
         if prediction:
@@ -130,59 +403,8 @@ with tab1:
         with st.expander("📈 Detailed Parameter Analysis", expanded=True):
             st.subheader("Parameter Evaluation")
             
-            # Create evaluation metrics
-            param_eval = {
-                'Parameter': ['pH', 'Temperature', 'Turbidity', 'Dissolved Oxygen', 'Conductivity'],
-                'Your Value': [ph, f"{temperature}°C", f"{turbidity} NTU", 
-                               f"{dissolved_oxygen} mg/L", f"{conductivity} µS/cm"],
-                'Safe Range': ['6.5-8.5', '< 30°C', '< 5 NTU', '≥ 6 mg/L', '< 1000 µS/cm'],
-                'Status': [
-                    '✅ Optimal' if 6.5 <= ph <= 8.5 else 
-                    '⚠️ Alkaline' if ph > 8.5 else 
-                    '⚠️ Acidic' if ph >= 4.5 else 
-                    '❌ Dangerous',
-                    
-                    '✅ Normal' if temperature < 30 else 
-                    '⚠️ Elevated' if temperature < 40 else 
-                    '❌ Extreme',
-                    
-                    '✅ Clear' if turbidity < 5 else 
-                    '⚠️ Cloudy' if turbidity < 20 else 
-                    '❌ Very Turbid',
-                    
-                    '✅ Healthy' if dissolved_oxygen >= 6 else 
-                    '⚠️ Low' if dissolved_oxygen >= 3 else 
-                    '❌ Hypoxic',
-                    
-                    '✅ Normal' if conductivity < 1000 else 
-                    '⚠️ High' if conductivity < 1500 else 
-                    '❌ Very High'
-                ],
-                'Health Impact': [
-                    'Ideal for drinking' if 6.5 <= ph <= 8.5 else 
-                    'May cause irritation' if 8.5 < ph <= 9.5 or 5.5 <= ph < 6.5 else 
-                    'Harmful to health',
-                    
-                    'No direct impact' if temperature < 30 else 
-                    'Affects taste' if temperature < 40 else 
-                    'Risk of scalding',
-                    
-                    'Clear and safe' if turbidity < 5 else 
-                    'May harbor pathogens' if turbidity < 20 else 
-                    'High pathogen risk',
-                    
-                    'Supports aquatic life' if dissolved_oxygen >= 6 else 
-                    'Stressful for organisms' if dissolved_oxygen >= 3 else 
-                    'Dangerously low oxygen',
-                    
-                    'Normal mineral content' if conductivity < 1000 else 
-                    'Elevated minerals' if conductivity < 1500 else 
-                    'Very high contamination risk'
-                ]
-            }
-            
             # Display as dataframe with colored status
-            eval_df = pd.DataFrame(param_eval)
+            eval_df = build_eval_df(ph, temperature, turbidity, dissolved_oxygen, conductivity)
             st.dataframe(
                 eval_df,
                 column_config={
@@ -198,7 +420,7 @@ with tab1:
                     )
                 },
                 hide_index=True,
-                use_container_width=True
+                width=EVAL_TABLE_WIDTH
             )
             
             # Visual indicators
@@ -207,87 +429,22 @@ with tab1:
             
             with col1:
                 st.metric("pH Level", f"{ph}", 
-                          delta="Optimal" if 6.5 <= ph <= 8.5 else "Caution",
-                          delta_color="normal" if 6.5 <= ph <= 8.5 else "off")
+                          delta="Optimal" if ph_ok else "Caution",
+                          delta_color="normal" if ph_ok else "off")
             
             with col2:
                 st.metric("Dissolved Oxygen", f"{dissolved_oxygen} mg/L", 
-                          delta="Healthy" if dissolved_oxygen >= 6 else "Low",
-                          delta_color="normal" if dissolved_oxygen >= 6 else "off")
+                          delta="Healthy" if do_ok else "Low",
+                          delta_color="normal" if do_ok else "off")
             
             with col3:
                 st.metric("Conductivity", f"{conductivity} µS/cm", 
-                          delta="Normal" if conductivity < 1000 else "High",
-                          delta_color="normal" if conductivity < 1000 else "off")
+                          delta="Normal" if cond_ok else "High",
+                          delta_color="normal" if cond_ok else "off")
 
 with tab2:
-    st.header("Extended Parameter Ranges")
-    st.markdown("""
-    This enhanced version includes wider measurement ranges for comprehensive water analysis:
-    """)
-    
-    # Parameter range cards
-    cols = st.columns(2)
-    
-    with cols[0]:
-        st.markdown("""
-        <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-            <h4 style="color:#005b96;">pH Level</h4>
-            <p><b>Range:</b> 0-14 (full pH scale)</p>
-            <p><b>Safe Range:</b> 6.5-8.5</p>
-            <p>Measures acidity/alkalinity. Extreme values can be harmful.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-            <h4 style="color:#005b96;">Temperature</h4>
-            <p><b>Range:</b> 0-50°C</p>
-            <p><b>Safe Range:</b> < 30°C</p>
-            <p>Affects chemical reactions and microbial growth.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with cols[1]:
-        st.markdown("""
-        <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-            <h4 style="color:#005b96;">Dissolved Oxygen</h4>
-            <p><b>Range:</b> 0-20 mg/L</p>
-            <p><b>Safe Range:</b> ≥ 6 mg/L</p>
-            <p>Essential for aquatic life and water quality.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background-color:#e6f7ff;padding:15px;border-radius:10px;margin-bottom:20px;">
-            <h4 style="color:#005b96;">Conductivity</h4>
-            <p><b>Range:</b> 0-2000 µS/cm</p>
-            <p><b>Safe Range:</b> < 1000 µS/cm</p>
-            <p>Indicates dissolved inorganic salts and minerals.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Range visualization
-    st.markdown("---")
-    st.subheader("Parameter Range Visualization")
-    
-    # Create a dummy plot (replace with actual visualizations if desired)
-    ranges = pd.DataFrame({
-        'Parameter': ['pH', 'Temperature', 'Turbidity', 'Dissolved Oxygen', 'Conductivity'],
-        'Min': [0, 0, 0, 0, 0],
-        'Max': [14, 50, 100, 20, 2000],
-        'Safe Min': [6.5, None, None, 6, None],
-        'Safe Max': [8.5, 30, 5, None, 1000]
-    })
-    
-    st.bar_chart(ranges.set_index('Parameter')[['Min', 'Max']])
-    st.caption("Full measurement ranges for each parameter")
+    render_ranges_tab()
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align:center;color:#666666;font-size:14px;">
-    <p>AquaSafe Pro Water Quality Classifier v2.0</p>
-    <p>For comprehensive water quality analysis</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file